@@ -11,6 +11,9 @@ from .roots import find_root
 from . import linalg
 
 
+__all__ = ["Corr"]
+
+
 class Corr:
     r"""The class for a correlator (time dependent sequence of pe.Obs).
 
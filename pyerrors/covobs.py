@@ -1,6 +1,9 @@
 import numpy as np
 
 
+__all__ = ["Covobs"]
+
+
 class Covobs:
 
     def __init__(self, mean, cov, name, pos=None, grad=None):
@@ -17,6 +17,10 @@ from numdifftools import Hessian as num_hessian
 from .obs import Obs, derived_observable, covariance, cov_Obs, invert_corr_cov_cholesky
 
 
+__all__ = ["Fit_result", "least_squares", "total_least_squares", "fit_lin", "qqplot",
+           "residual_plot", "error_band", "ks_test"]
+
+
 class Fit_result(Sequence):
     """Represents fit results.
 
@@ -1,5 +1,6 @@
 import numpy as np
 import autograd.numpy as anp  # Thinly-wrapped numpy
+from autograd.extend import primitive, defvjp
 from .obs import derived_observable, CObs, Obs, import_jackknife
 
 
@@ -17,39 +18,19 @@ def matmul(*operands):
     if any(isinstance(o[0, 0], CObs) for o in operands):
         extended_operands = []
         for op in operands:
-            tmp = np.vectorize(lambda x: (np.real(x), np.imag(x)))(op)
-            extended_operands.append(tmp[0])
-            extended_operands.append(tmp[1])
+            extended_operands.append(np.fromiter((x if isinstance(x, Obs) else x.real for x in op.flat), dtype=object, count=op.size).reshape(op.shape))
+            extended_operands.append(np.fromiter((0 if isinstance(x, Obs) else x.imag for x in op.flat), dtype=object, count=op.size).reshape(op.shape))
 
-        def multi_dot(operands, part):
-            stack_r = operands[0]
-            stack_i = operands[1]
+        def multi_dot(operands):
+            stack = operands[0] + 1j * operands[1]
             for op_r, op_i in zip(operands[2::2], operands[3::2]):
-                tmp_r = stack_r @ op_r - stack_i @ op_i
-                tmp_i = stack_r @ op_i + stack_i @ op_r
-
-                stack_r = tmp_r
-                stack_i = tmp_i
-
-            if part == 'Real':
-                return stack_r
-            else:
-                return stack_i
-
-        def multi_dot_r(operands):
-            return multi_dot(operands, 'Real')
-
-        def multi_dot_i(operands):
-            return multi_dot(operands, 'Imag')
+                stack = stack @ (op_r + 1j * op_i)
+            # Real and imaginary part are obtained from a single derived_observable call
+            return anp.stack([anp.real(stack), anp.imag(stack)])
 
-        Nr = derived_observable(multi_dot_r, extended_operands, array_mode=True)
-        Ni = derived_observable(multi_dot_i, extended_operands, array_mode=True)
+        N = derived_observable(multi_dot, extended_operands, array_mode=True)
 
-        res = np.empty_like(Nr)
-        for (n, m), entry in np.ndenumerate(Nr):
-            res[n, m] = CObs(Nr[n, m], Ni[n, m])
-
-        return res
+        return np.frompyfunc(CObs, 2, 1)(N[0], N[1])
     else:
         def multi_dot(operands):
             stack = operands[0]
@@ -214,19 +195,11 @@ def det(x):
 def _scalar_mat_op(op, obs, **kwargs):
     """Computes the matrix to scalar operation op to a given matrix of Obs."""
     def _mat(x, **kwargs):
-        dim = int(np.sqrt(len(x)))
-
-        mat = []
-        for i in range(dim):
-            row = []
-            for j in range(dim):
-                row.append(x[j + dim * i])
-            mat.append(row)
-
-        return op(anp.array(mat))
+        dim = int(np.sqrt(np.size(x)))
+        return op(anp.reshape(x, (dim, dim)))
 
     if isinstance(obs, np.ndarray):
-        raveled_obs = (1 * (obs.ravel())).tolist()
+        raveled_obs = obs.ravel().tolist()
     else:
         raise TypeError('Unproper type of input.')
     return derived_observable(_mat, raveled_obs, **kwargs)
@@ -245,46 +218,120 @@ def _mat_mat_op(op, obs, **kwargs):
             else:
                 A[n, m] = entry
                 B[n, m] = 0.0
-        big_matrix = np.block([[A, -B], [B, A]])
-        op_big_matrix = derived_observable(lambda x, **kwargs: op(x), [big_matrix], array_mode=True)[0]
-        dim = op_big_matrix.shape[0]
-        op_A = op_big_matrix[0: dim // 2, 0: dim // 2]
-        op_B = op_big_matrix[dim // 2:, 0: dim // 2]
-        res = np.empty_like(op_A)
-        for (n, m), entry in np.ndenumerate(op_A):
-            res[n, m] = CObs(op_A[n, m], op_B[n, m])
-        return res
+        if op is anp.linalg.inv:
+            # autograd differentiates inv correctly for complex input, no need for the doubled real representation.
+            # This does not hold for pinv, whose vjp uses plain instead of conjugate transposes.
+            def _complex_op(x, **kwargs):
+                res = op(x[0] + 1j * x[1])
+                return anp.stack([anp.real(res), anp.imag(res)])
+
+            op_A, op_B = derived_observable(_complex_op, [A, B], array_mode=True)
+        else:
+            # The real representation [[A, -B], [B, A]] is built inside the differentiated function
+            def _real_op(x, **kwargs):
+                dim = x.shape[-1]
+                big_matrix = anp.concatenate([anp.concatenate([x[0], -x[1]], axis=1),
+                                              anp.concatenate([x[1], x[0]], axis=1)])
+                res = op(big_matrix)
+                return anp.stack([res[:dim, :dim], res[dim:, :dim]])
+
+            op_A, op_B = derived_observable(_real_op, [A, B], array_mode=True)
+        return np.frompyfunc(CObs, 2, 1)(op_A, op_B)
     else:
         return derived_observable(lambda x, **kwargs: op(x), [obs], array_mode=True)[0]
 
 
 def eigh(obs, **kwargs):
     """Computes the eigenvalues and eigenvectors of a given hermitian matrix of Obs according to np.linalg.eigh."""
-    w = derived_observable(lambda x, **kwargs: anp.linalg.eigh(x)[0], obs)
-    v = derived_observable(lambda x, **kwargs: anp.linalg.eigh(x)[1], obs)
+    dim = np.shape(obs)[-1]
+
+    def _eigh(x, **kwargs):
+        w, v = anp.linalg.eigh(x)
+        return anp.concatenate([w, anp.ravel(v)])
+
+    res = derived_observable(_eigh, obs, array_mode=True)
+    w = res[:dim]
+    v = res[dim:].reshape(dim, dim)
     return w, v
 
 
 def eig(obs, **kwargs):
     """Computes the eigenvalues of a given matrix of Obs according to np.linalg.eig."""
-    w = derived_observable(lambda x, **kwargs: anp.real(anp.linalg.eig(x)[0]), obs)
+    w = derived_observable(lambda x, **kwargs: anp.real(_eig(x)[0]), obs, array_mode=True)
     return w
 
 
 def eigv(obs, **kwargs):
     """Computes the eigenvectors of a given hermitian matrix of Obs according to np.linalg.eigh."""
-    v = derived_observable(lambda x, **kwargs: anp.linalg.eigh(x)[1], obs)
+    v = derived_observable(lambda x, **kwargs: anp.linalg.eigh(x)[1], obs, array_mode=True)
     return v
 
 
 def pinv(obs, **kwargs):
     """Computes the Moore-Penrose pseudoinverse of a matrix of Obs."""
-    return derived_observable(lambda x, **kwargs: anp.linalg.pinv(x), obs)
+    return derived_observable(lambda x, **kwargs: anp.linalg.pinv(x), obs, array_mode=True)
 
 
 def svd(obs, **kwargs):
     """Computes the singular value decomposition of a matrix of Obs."""
-    u = derived_observable(lambda x, **kwargs: anp.linalg.svd(x, full_matrices=False)[0], obs)
-    s = derived_observable(lambda x, **kwargs: anp.linalg.svd(x, full_matrices=False)[1], obs)
-    vh = derived_observable(lambda x, **kwargs: anp.linalg.svd(x, full_matrices=False)[2], obs)
+    m, n = np.shape(obs)
+    k = min(m, n)
+
+    def _svd(x, **kwargs):
+        u, s, vh = anp.linalg.svd(x, full_matrices=False)
+        return anp.concatenate([anp.ravel(u), s, anp.ravel(vh)])
+
+    res = derived_observable(_svd, obs, array_mode=True)
+    u = res[:m * k].reshape(m, k)
+    s = res[m * k: m * k + k]
+    vh = res[m * k + k:].reshape(k, n)
     return (u, s, vh)
+
+
+@primitive
+def _eig(x):
+    """Eigenvalues and right eigenvectors of a general square matrix."""
+    return tuple(np.linalg.eig(x))
+
+
+def _matrix_diag(a):
+    """Stack of diagonal matrices with the last axis of a on the diagonal."""
+    n = a.shape[-1]
+    out = np.zeros(a.shape + (n,), dtype=a.dtype)
+    out[..., np.arange(n), np.arange(n)] = a
+    return out
+
+
+def _grad_eig(ans, x):
+    """Gradient of the eigendecomposition of a general square matrix, see arXiv:1701.00392 Eq. (4.77).
+
+    Same as the vjp of autograd.numpy.linalg.eig but the matrix products are
+    carried out with matmul instead of einsum and diagonal matrices are never
+    multiplied out. Only first derivatives are supported.
+
+    This replaces autograd's vjp for eig within pyerrors, fixes to grad_eig in
+    autograd.numpy.linalg have to be ported here by hand.
+    """
+    e, u = ans
+    n = e.shape[-1]
+    f = 1 / (e[..., np.newaxis, :] - e[..., :, np.newaxis] + 1.0e-20)
+    f[..., np.arange(n), np.arange(n)] = 0
+    ut = np.swapaxes(u, -1, -2)
+    ut_u_conj = ut @ np.conj(u)
+    inv_ut = np.linalg.inv(ut)
+
+    def vjp(g):
+        ge, gu = g
+        ge = _matrix_diag(ge)
+        ut_gu = ut @ gu
+        r1 = f * ut_gu
+        r2 = -f * (ut_u_conj * np.real(np.diagonal(ut_gu, axis1=-2, axis2=-1))[..., np.newaxis, :])
+        r = inv_ut @ (ge + r1 + r2) @ ut
+        if not np.iscomplexobj(x):
+            r = np.real(r)
+        return r
+
+    return vjp
+
+
+defvjp(_eig, _grad_eig)
@@ -9,6 +9,9 @@ from .obs import Obs
 from .version import __version__
 
 
+__all__ = ["print_config", "errorbar", "dump_object", "load_object", "pseudo_Obs", "gen_correlated_data"]
+
+
 def print_config():
     """Print information about version of python, pyerrors and dependencies."""
     config = {"system": platform.system(),
@@ -4,13 +4,20 @@ import pickle
 import numpy as np
 import autograd.numpy as anp  # Thinly-wrapped numpy
 import scipy
-from autograd import jacobian
+from autograd import make_vjp
+from autograd.extend import vspace
 import matplotlib.pyplot as plt
 from scipy.stats import skew, skewtest, kurtosis, kurtosistest
 import numdifftools as nd
 from itertools import groupby
 from .covobs import Covobs
 
+
+__all__ = ["Obs", "CObs", "gamma_method", "gm", "derived_observable", "reweight", "correlate",
+           "covariance", "invert_corr_cov_cholesky", "sort_corr", "import_jackknife",
+           "import_bootstrap", "merge_obs", "cov_Obs"]
+
+
 # Improve print output of numpy.ndarrays containing Obs objects.
 np.set_printoptions(formatter={'object': lambda x: str(x)})
 
@@ -1167,6 +1174,19 @@ def _expand_deltas_for_merge(deltas, idx, shape, new_idx, scalefactor):
     return np.array([ret[new_idx[i] - new_idx[0]] for i in range(len(new_idx))]) * len(new_idx) / len(idx) * scalefactor
 
 
+def _value_and_jacobian(func, x, **kwargs):
+    """Evaluate func(x, **kwargs) together with its jacobian with respect to x.
+
+    Equivalent to (func(x, **kwargs), autograd.jacobian(func)(x, **kwargs)) but
+    the value is taken from the forward pass of the autograd trace such that
+    func is only evaluated once.
+    """
+    vjp, ans = make_vjp(func)(x, **kwargs)
+    ans_vspace = vspace(ans)
+    grads = [vjp(basis) for basis in ans_vspace.standard_basis()]
+    return ans, np.reshape(np.stack(grads), ans_vspace.shape + vspace(x).shape)
+
+
 def derived_observable(func, data, array_mode=False, **kwargs):
     """Construct a derived Obs according to func(data, **kwargs) using automatic differentiation.
 
@@ -1215,35 +1235,39 @@ def derived_observable(func, data, array_mode=False, **kwargs):
                 allcov[name] = o.covobs[name].cov
 
     n_obs = len(raveled_data)
-    new_names = sorted(set([y for x in [o.names for o in raveled_data] for y in x]))
-    new_cov_names = sorted(set([y for x in [o.cov_names for o in raveled_data] for y in x]))
+    new_names = sorted({name for o in raveled_data for name in o.names})
+    new_cov_names = sorted({name for o in raveled_data for name in o.cov_names})
     new_sample_names = sorted(set(new_names) - set(new_cov_names))
 
     reweighted = len(list(filter(lambda o: o.reweighted is True, raveled_data))) > 0
 
-    if data.ndim == 1:
-        values = np.array([o.value for o in data])
-    else:
-        values = np.vectorize(lambda x: x.value)(data)
+    values = np.fromiter((o.value for o in raveled_data), dtype=np.float64, count=n_obs).reshape(data.shape)
 
-    new_values = func(values, **kwargs)
+    if 'man_grad' in kwargs or kwargs.get('num_grad') is True:
+        new_values = func(values, **kwargs)
+    else:
+        new_values, deriv = _value_and_jacobian(func, values, **kwargs)
 
     multi = int(isinstance(new_values, np.ndarray))
 
+    # Collect idl and replica means in a single pass over the ensembles each Obs is defined on
+    idl_d = {name: [] for name in new_sample_names}
+    r_values_d = {name: values.flatten() for name in new_sample_names}
+    for i, item in enumerate(raveled_data):
+        for name, idx in item.idl.items():
+            if name in idl_d:
+                idl_d[name].append(idx)
+                r_values_d[name][i] = item.r_values.get(name, item.value)
+
     new_r_values = {}
     new_idl_d = {}
     for name in new_sample_names:
-        idl = []
-        tmp_values = np.zeros(n_obs)
-        for i, item in enumerate(raveled_data):
-            tmp_values[i] = item.r_values.get(name, item.value)
-            tmp_idl = item.idl.get(name)
-            if tmp_idl is not None:
-                idl.append(tmp_idl)
-        if multi > 0:
-            tmp_values = np.array(tmp_values).reshape(data.shape)
-        new_r_values[name] = func(tmp_values, **kwargs)
-        new_idl_d[name] = _merge_idx(idl)
+        new_idl_d[name] = _merge_idx(idl_d[name])
+        # No need to reevaluate func if the replica means coincide with the central values
+        if np.array_equal(r_values_d[name], values.ravel()):
+            new_r_values[name] = new_values
+            continue
+        new_r_values[name] = func(r_values_d[name].reshape(data.shape), **kwargs)
 
     def _compute_scalefactor_missing_rep(obs):
         """
@@ -1283,44 +1307,46 @@ def derived_observable(func, data, array_mode=False, **kwargs):
             deriv = np.array([tmp_df.real])
         else:
             deriv = tmp_df.real
-    else:
-        deriv = jacobian(func)(values, **kwargs)
-
-    final_result = np.zeros(new_values.shape, dtype=object)
 
     if array_mode is True:
 
-        class _Zero_grad():
-            def __init__(self, N):
-                self.grad = np.zeros((N, 1))
-
         new_covobs_lengths = dict(set([y for x in [[(n, o.covobs[n].N) for n in o.cov_names] for o in raveled_data] for y in x]))
+        scalef_list = [_compute_scalefactor_missing_rep(o) for o in raveled_data]
+        # Deltas (gradients) of all input Obs are collected in one contiguous array per ensemble (covobs).
         d_extracted = {}
         g_extracted = {}
         for name in new_sample_names:
-            d_extracted[name] = []
             ens_length = len(new_idl_d[name])
-            for i_dat, dat in enumerate(data):
-                d_extracted[name].append(np.array([_expand_deltas_for_merge(o.deltas.get(name, np.zeros(ens_length)), o.idl.get(name, new_idl_d[name]), o.shape.get(name, ens_length), new_idl_d[name], _compute_scalefactor_missing_rep(o).get(name.split('|')[0], 1)) for o in dat.reshape(np.prod(dat.shape))]).reshape(dat.shape + (ens_length, )))
+            d_extracted[name] = np.zeros((n_obs, ens_length))
+            for i_obs, o in enumerate(raveled_data):
+                if name in o.deltas:
+                    d_extracted[name][i_obs] = _expand_deltas_for_merge(o.deltas[name], o.idl[name], o.shape[name], new_idl_d[name], scalef_list[i_obs].get(name.split('|')[0], 1))
         for name in new_cov_names:
-            g_extracted[name] = []
-            zero_grad = _Zero_grad(new_covobs_lengths[name])
-            for i_dat, dat in enumerate(data):
-                g_extracted[name].append(np.array([o.covobs.get(name, zero_grad).grad for o in dat.reshape(np.prod(dat.shape))]).reshape(dat.shape + (new_covobs_lengths[name], 1)))
+            g_extracted[name] = np.zeros((n_obs, new_covobs_lengths[name]))
+            for i_obs, o in enumerate(raveled_data):
+                if name in o.covobs:
+                    g_extracted[name][i_obs] = o.covobs[name].grad.ravel()
+
+        # Contract the jacobian with the deltas (gradients) of all input Obs, one matrix product per ensemble (covobs).
+        deriv_flat = deriv.reshape(np.size(new_values), n_obs)
+        new_deltas_all = {name: (deriv_flat @ d_extracted[name]).reshape(np.shape(new_values) + (len(new_idl_d[name]), )) for name in new_sample_names}
+        new_grad_all = {name: (deriv_flat @ g_extracted[name]).reshape(np.shape(new_values) + (new_covobs_lengths[name], 1)) for name in new_cov_names}
 
-    for i_val, new_val in np.ndenumerate(new_values):
+    if multi == 0:
+        # A scalar result does not need the object array and the index loop
+        new_entries = [((), new_values)]
+    else:
+        final_result = np.zeros(new_values.shape, dtype=object)
+        new_entries = np.ndenumerate(new_values)
+
+    for i_val, new_val in new_entries:
         new_deltas = {}
         new_grad = {}
         if array_mode is True:
             for name in new_sample_names:
-                ens_length = d_extracted[name][0].shape[-1]
-                new_deltas[name] = np.zeros(ens_length)
-                for i_dat, dat in enumerate(d_extracted[name]):
-                    new_deltas[name] += np.tensordot(deriv[i_val + (i_dat, )], dat)
+                new_deltas[name] = new_deltas_all[name][i_val]
             for name in new_cov_names:
-                new_grad[name] = 0
-                for i_dat, dat in enumerate(g_extracted[name]):
-                    new_grad[name] += np.tensordot(deriv[i_val + (i_dat, )], dat)
+                new_grad[name] = new_grad_all[name][i_val]
         else:
             for j_obs, obs in np.ndenumerate(data):
                 scalef_d = _compute_scalefactor_missing_rep(obs)
@@ -1344,15 +1370,17 @@ def derived_observable(func, data, array_mode=False, **kwargs):
                 new_idl.append(new_idl_d[name])
                 new_means.append(new_r_values[name][i_val])
                 new_names_obs.append(name)
-        final_result[i_val] = Obs(new_samples, new_names_obs, means=new_means, idl=new_idl)
+        new_obs = Obs(new_samples, new_names_obs, means=new_means, idl=new_idl)
         for name in new_covobs:
-            final_result[i_val].names.append(name)
-        final_result[i_val]._covobs = new_covobs
-        final_result[i_val]._value = new_val
-        final_result[i_val].reweighted = reweighted
+            new_obs.names.append(name)
+        new_obs._covobs = new_covobs
+        new_obs._value = new_val
+        new_obs.reweighted = reweighted
 
-    if multi == 0:
-        final_result = final_result.item()
+        if multi == 0:
+            final_result = new_obs
+        else:
+            final_result[i_val] = new_obs
 
     return final_result
 
@@ -4,6 +4,9 @@ from autograd import jacobian
 from .obs import derived_observable
 
 
+__all__ = ["find_root"]
+
+
 def find_root(d, func, guess=1.0, **kwargs):
     r'''Finds the root of the function func(x, d) where d is an `Obs`.
 
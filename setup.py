@@ -24,6 +24,7 @@ setup(name='pyerrors',
       author_email='fabian.joswig@ed.ac.uk',
       license="MIT",
       packages=find_packages(),
+      package_data={'pyerrors': ['README.md']},
       python_requires='>=3.9.0',
       install_requires=['numpy>=2.0', 'autograd>=1.7.0', 'numdifftools>=0.9.41', 'matplotlib>=3.9', 'scipy>=1.13', 'iminuit>=2.28', 'h5py>=3.11', 'lxml>=5.0', 'python-rapidjson>=1.20', 'pandas>=2.2'],
       extras_require={'test': ['pytest', 'pytest-cov', 'pytest-benchmark', 'hypothesis', 'nbmake', 'flake8']},
@@ -0,0 +1,33 @@
+import importlib
+import pyerrors as pe
+import pytest
+
+
+@pytest.mark.parametrize("module, exports", [("obs", pe._OBS_EXPORTS),
+                                             ("covobs", pe._COVOBS_EXPORTS),
+                                             ("correlators", pe._CORRELATORS_EXPORTS),
+                                             ("fits", pe._FITS_EXPORTS),
+                                             ("misc", pe._MISC_EXPORTS),
+                                             ("roots", pe._ROOTS_EXPORTS)])
+def test_exports_match_all(module, exports):
+    mod = importlib.import_module("pyerrors." + module)
+    assert sorted(exports) == sorted(mod.__all__)
+    for name in exports:
+        assert getattr(pe, name) is getattr(mod, name)
+
+
+def test_lazy_attribute_access():
+    for name in pe._SUBMODULES:
+        assert getattr(pe, name) is importlib.import_module("pyerrors." + name)
+    assert set(pe.__all__) <= set(dir(pe))
+    with pytest.raises(AttributeError):
+        pe.not_an_attribute
+
+
+def test_star_import():
+    namespace = {}
+    exec("from pyerrors import *", namespace)
+    assert set(pe.__all__) <= set(namespace)
+    assert namespace["Obs"] is pe.obs.Obs
+    assert namespace["Corr"] is pe.correlators.Corr
+    assert namespace["Covobs"] is pe.covobs.Covobs
@@ -1,5 +1,6 @@
 import numpy as np
 import autograd.numpy as anp
+from autograd import jacobian
 import math
 import pyerrors as pe
 import pytest
@@ -320,6 +321,14 @@ def test_matrix_functions():
 
     pe.linalg.pinv(matrix[:,:3])
 
+    # Check svd of a rectangular matrix
+    u, v, vh = pe.linalg.svd(matrix[:, :3])
+    assert u.shape == (dim, 3) and v.shape == (3,) and vh.shape == (3, 3)
+    diff = matrix[:, :3] - u @ np.diag(v) @ vh
+
+    for (i, j), entry in np.ndenumerate(diff):
+        assert entry.is_zero()
+
 
 def test_complex_matrix_operations():
     dimension = 4
@@ -359,3 +368,19 @@ def test_complex_matrix_real_entries():
     my_mat[2, 0] = pe.Obs([np.random.normal(1.0, 0.1, 100)], ['t'])
     assert np.all((my_mat @ pe.linalg.inv(my_mat) - np.identity(4)) == 0)
 
+
+def test_complex_mat_mat_op_real_representation():
+    my_mat = get_complex_matrix(3)
+    my_mat[0, 1] = pe.Obs([np.random.normal(1.0, 0.1, 100)], ['t'])
+    square = pe.linalg._mat_mat_op(lambda x: x @ x, my_mat)
+    diff = square - my_mat @ my_mat
+    for (i, j), entry in np.ndenumerate(diff):
+        assert entry.is_zero()
+
+
+def test_eig_grad():
+    mat = np.random.normal(size=(5, 5))
+    for idx in range(2):
+        custom = jacobian(lambda x: anp.real(pe.linalg._eig(x)[idx]))(mat)
+        reference = jacobian(lambda x: anp.real(anp.linalg.eig(x)[idx]))(mat)
+        assert np.allclose(custom, reference)
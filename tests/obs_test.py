@@ -1,5 +1,6 @@
 import numpy as np
 import autograd.numpy as anp
+from autograd import jacobian
 import os
 import copy
 import matplotlib.pyplot as plt
@@ -331,6 +332,23 @@ def test_derived_observables():
     assert i_am_one.e_ddvalue['t'] <= 2 * np.finfo(np.float64).eps
 
 
+def test_value_and_jacobian():
+    x = np.random.rand(3, 3) + 3 * np.identity(3)
+    for func in [lambda x, **kwargs: x[0] * anp.sin(x[1]),
+                 lambda x, **kwargs: anp.linalg.inv(x),
+                 lambda x, **kwargs: anp.linalg.det(x)]:
+        val, jac = pe.obs._value_and_jacobian(func, x)
+        assert np.allclose(val, func(x))
+        assert np.allclose(jac, jacobian(func)(x))
+
+
+def test_derived_observable_matrix_input_scalar_output():
+    matrix = np.array([[pe.Obs([np.random.normal(1 + 3 * (i == j), 0.1, 50), np.random.normal(1 + 3 * (i == j), 0.1, 60)], ['E|r1', 'E|r2']) for j in range(3)] for i in range(3)])
+    det = pe.derived_observable(lambda x, **kwargs: anp.linalg.det(x), matrix)
+    assert (det - pe.linalg.det(matrix)).is_zero()
+    assert det.r_values == pe.linalg.det(matrix).r_values
+
+
 def test_multi_ens():
     names = ['A0', 'A1|r001', 'A1|r002']
     test_obs = pe.Obs([np.random.rand(50), np.random.rand(50), np.random.rand(50)], names)